@@ -5,119 +5,379 @@ import React, { useEffect, useMemo, useRef, useState } from "react";
 // Works out-of-the-box against Google Books public API. Optional API key support via ?key=YOUR_KEY
 
 const PAGE_SIZE = 12;
+// One request covers several pages; the API caps maxResults at 40, so 3 × 12 = 36 keeps pages aligned
+const WINDOW_PAGES = 3;
+const WINDOW_SIZE = PAGE_SIZE * WINDOW_PAGES;
+const CACHE_MAX_ENTRIES = 64;
+const CACHE_TTL_MS = 120_000;
+const REVALIDATE_AFTER_MS = 30_000; // cached entries younger than this are served without revalidating
+const REQUEST_TIMEOUT_MS = 10_000;
 
-function StarRating({ value = 0, count = 5 }) {
-  const full = Math.floor(value);
-  const half = value % 1 >= 0.5;
-  const stars = Array.from({ length: count }, (_, i) => {
-    if (i < full) return "★";
-    if (i === full && half) return "☆"; // simple half-state fallback
-    return "✩";
+function isFresh(entry) {
+  return Date.now() - entry.ts < CACHE_TTL_MS;
+}
+
+// Map-backed LRU: insertion order doubles as recency order, so the first key is the eldest
+function lruGet(map, key) {
+  const entry = map.get(key);
+  if (!entry) return undefined;
+  map.delete(key);
+  if (!isFresh(entry)) return undefined; // stale: drop and refetch
+  map.set(key, entry);
+  return entry;
+}
+
+function lruSet(map, key, value) {
+  map.delete(key);
+  if (map.size >= CACHE_MAX_ENTRIES) map.delete(map.keys().next().value);
+  map.set(key, { ...value, ts: Date.now() });
+}
+
+// Builds parseVolumes. Everything it needs lives inside this function so its source can
+// also be shipped verbatim to the parser worker below (see getParserWorker).
+function createVolumeParser() {
+  const PLACEHOLDER_COVER = "https://via.placeholder.com/128x192?text=No+Cover";
+
+  // Flatten a Google Books volume into exactly the fields a card renders, once per fetch.
+  // Cards read these directly, and the cache holds the small shape instead of the raw payload.
+  function normalize(item) {
+    const info = item.volumeInfo || {};
+    const sale = item.saleInfo || {};
+    const cover = info.imageLinks?.thumbnail || info.imageLinks?.smallThumbnail || PLACEHOLDER_COVER;
+    return {
+      id: item.id,
+      title: info.title || "Untitled",
+      authors: (info.authors || []).join(", "),
+      // Google Books hands out http: cover URLs; upgrade them to avoid mixed-content blocking/retries
+      thumb: cover.replace(/^http:/, "https:"),
+      publishedDate: info.publishedDate,
+      pageCount: info.pageCount,
+      category: info.categories?.[0],
+      rating: typeof info.averageRating === "number" ? info.averageRating : null,
+      previewLink: info.previewLink,
+      buyLink: sale.buyLink,
+      infoLink: info.infoLink,
+    };
+  }
+
+  return function parseVolumes(data) {
+    const items = Array.isArray(data.items) ? data.items.map(normalize) : [];
+    const total = typeof data.totalItems === "number" ? data.totalItems : items.length;
+    return { items, total };
+  };
+}
+
+const parseVolumes = createVolumeParser();
+
+// JSON.parse + normalize run in an inline worker so large payloads don't block rendering.
+// The worker is created lazily from a blob: URL (keeping the app a single file); where that is
+// unavailable or blocked, parsing falls back to the main thread.
+let parserWorker; // undefined until first use, null when workers are unavailable
+let parserJobId = 0;
+const parserJobs = new Map(); // job id -> { resolve, reject, fallback }
+
+function getParserWorker() {
+  if (parserWorker !== undefined) return parserWorker;
+  parserWorker = null;
+  if (typeof Worker === "undefined" || typeof Blob === "undefined") return null;
+  try {
+    const source = `const parseVolumes = (${createVolumeParser})();
+onmessage = ({ data: { id, buffer } }) => {
+  let result;
+  try {
+    result = parseVolumes(JSON.parse(new TextDecoder().decode(buffer)));
+  } catch (err) {
+    postMessage({ id, error: String(err && err.message) });
+    return;
+  }
+  postMessage({ id, result });
+};`;
+    const url = URL.createObjectURL(new Blob([source], { type: "text/javascript" }));
+    const worker = new Worker(url);
+    URL.revokeObjectURL(url); // the worker has already taken the script
+    worker.onmessage = ({ data: { id, result, error } }) => {
+      const job = parserJobs.get(id);
+      if (!job) return;
+      parserJobs.delete(id);
+      if (error !== undefined) job.reject(new Error(error));
+      else job.resolve(result);
+    };
+    worker.onerror = () => {
+      // The worker failed to load (e.g. a CSP without blob: workers) or threw outside its per-message
+      // try/catch: stop using it and parse on the main thread from now on
+      worker.terminate();
+      parserWorker = null;
+      for (const job of parserJobs.values()) job.fallback();
+      parserJobs.clear();
+    };
+    parserWorker = worker;
+  } catch {
+    parserWorker = null;
+  }
+  return parserWorker;
+}
+
+// The buffer is copied rather than transferred so the main thread can still parse it if the worker fails
+function parseBuffer(buffer) {
+  const parseHere = () => parseVolumes(JSON.parse(new TextDecoder().decode(buffer)));
+  const worker = getParserWorker();
+  if (!worker) return Promise.resolve().then(parseHere);
+  return new Promise((resolve, reject) => {
+    const id = ++parserJobId;
+    const fallback = () => {
+      try {
+        resolve(parseHere());
+      } catch (err) {
+        reject(err);
+      }
+    };
+    parserJobs.set(id, { resolve, reject, fallback });
+    worker.postMessage({ id, buffer });
   });
+}
+
+function sameIds(a, b) {
+  return a.length === b.length && a.every((item, i) => item.id === b[i].id);
+}
+
+// Persist the freshest cache entries across reloads and back/forward navigations.
+// Bump the version whenever the cached entry shape changes so old sessions are ignored.
+const PERSIST_KEY = "bf_cache";
+const PERSIST_VERSION = 2;
+const PERSIST_MAX_ENTRIES = 32;
+
+function loadPersistedCache() {
+  try {
+    const raw = sessionStorage.getItem(PERSIST_KEY);
+    if (!raw) return new Map();
+    const { v, entries } = JSON.parse(raw);
+    if (v !== PERSIST_VERSION || !Array.isArray(entries)) return new Map();
+    return new Map(entries.filter(([, entry]) => isFresh(entry)));
+  } catch {
+    return new Map(); // storage unavailable or corrupt
+  }
+}
+
+function persistCache(map) {
+  try {
+    const entries = [...map].filter(([, entry]) => isFresh(entry)).slice(-PERSIST_MAX_ENTRIES);
+    sessionStorage.setItem(PERSIST_KEY, JSON.stringify({ v: PERSIST_VERSION, entries }));
+  } catch {
+    // Quota exceeded or storage disabled; the in-memory cache still works
+  }
+}
+
+const SEARCH_BASE = "https://www.googleapis.com/books/v1/volumes";
+
+// Combine the caller's cancel signal with a hard timeout managed by the browser, so no
+// extra controller or timer is needed per request. Older browsers just get the cancel signal.
+function withTimeout(signal) {
+  if (typeof AbortSignal.any !== "function" || typeof AbortSignal.timeout !== "function") return signal;
+  return AbortSignal.any([signal, AbortSignal.timeout(REQUEST_TIMEOUT_MS)]);
+}
+
+// Collapse case and whitespace so equivalent queries share one cache key and one request
+function normalizeQuery(text) {
+  return text.trim().toLowerCase().replace(/\s+/g, " ");
+}
+
+// Pagination is offset-based: Google Books exposes no cursor or continuation token, and
+// rewriting the query (e.g. adding intitle:/inauthor: filters) to skip ahead would change
+// the result set rather than page through it. Deep pages therefore pay the server's
+// startIndex cost; the windowed fetch keeps that to one request per WINDOW_PAGES pages.
+function buildSearchUrl(query, startIndex) {
+  // Optional: if you have an API key, append here, e.g. `&key=YOUR_KEY`
+  return `${SEARCH_BASE}?q=${encodeURIComponent(query || "")}&startIndex=${startIndex}&maxResults=${WINDOW_SIZE}&printType=books`;
+}
+
+// Polite prefetch: skip speculative requests when the user asked to save data or is on a very slow link
+function canPrefetch() {
+  const conn = typeof navigator !== "undefined" ? navigator.connection : undefined;
+  if (!conn) return true;
+  return !conn.saveData && conn.effectiveType !== "slow-2g";
+}
+
+// Every possible 5-star row, indexed by rating in half-star steps (0, 0.5, …, 5 → 0…10)
+const STARS = Object.freeze(
+  Array.from({ length: 11 }, (_, halves) => {
+    const full = Math.floor(halves / 2);
+    return Array.from({ length: 5 }, (_, i) => {
+      if (i < full) return "★";
+      if (i === full && halves % 2) return "☆"; // simple half-state fallback
+      return "✩";
+    }).join(" ");
+  })
+);
+
+function StarRating({ value = 0 }) {
+  const idx = Math.max(0, Math.min(10, Math.floor(value * 2)));
   return (
-    <div aria-label={`Rating: ${value} out of ${count}`} className="text-sm">
-      <span className="tracking-wider" style={{ fontFeatureSettings: '"kern"' }}>{stars.join(" ")}</span>
+    <div aria-label={`Rating: ${value} out of 5`} className="text-sm">
+      <span className="tracking-wider" style={{ fontFeatureSettings: '"kern"' }}>{STARS[idx]}</span>
     </div>
   );
 }
 
-function ResultCard({ volume }) {
-  const info = volume.volumeInfo || {};
-  const sale = volume.saleInfo || {};
-  const thumb =
-    (info.imageLinks && (info.imageLinks.thumbnail || info.imageLinks.smallThumbnail)) ||
-    "https://via.placeholder.com/128x192?text=No+Cover";
-  const authors = (info.authors || []).join(", ");
+// Loading placeholder: one element tiled with an SVG card outline, so the whole grid is a
+// single animated layer instead of PAGE_SIZE pulsing cards
+const SKELETON_TILE = encodeURIComponent(
+  "<svg xmlns='http://www.w3.org/2000/svg' width='336' height='216'>" +
+    "<rect x='0.5' y='0.5' width='319' height='199' rx='16' fill='white' stroke='#e5e5e5'/>" +
+    "<rect x='16' y='16' width='96' height='144' rx='12' fill='#e5e5e5'/>" +
+    "<rect x='128' y='16' width='160' height='16' rx='4' fill='#e5e5e5'/>" +
+    "<rect x='128' y='44' width='96' height='12' rx='4' fill='#e5e5e5'/>" +
+    "</svg>"
+);
+const SKELETON_STYLE = {
+  backgroundImage: `url("data:image/svg+xml,${SKELETON_TILE}")`,
+  backgroundRepeat: "repeat",
+};
+
+const BTN_CLASS = "rounded-xl border px-3 py-1.5 text-xs font-medium hover:bg-neutral-50 focus:outline-none focus:ring-2 focus:ring-neutral-400";
+
+// External link styled as a small button; renders nothing when the volume lacks that link
+const LinkButton = React.memo(function LinkButton({ href, label }) {
+  if (!href) return null;
   return (
-    <article className="group rounded-2xl border border-neutral-200 bg-white p-4 shadow-sm hover:shadow-md transition-shadow focus-within:shadow-md">
-      <div className="grid grid-cols-[96px,1fr] gap-4">
-        <div className="overflow-hidden rounded-xl border bg-neutral-50">
-          <img
-            src={thumb}
-            alt={`Cover of ${info.title || "Untitled"}`}
-            className="h-36 w-24 object-cover object-center transition-transform group-hover:scale-[1.02]"
-            loading="lazy"
-          />
-        </div>
-        <div className="min-w-0">
-          <h3 className="text-base font-semibold leading-snug line-clamp-2" title={info.title}>
-            {info.title || "Untitled"}
-          </h3>
-          {authors && (
-            <p className="mt-1 text-sm text-neutral-600 line-clamp-1" title={authors}>
-              {authors}
-            </p>
-          )}
-          <div className="mt-2 flex flex-wrap items-center gap-2 text-xs text-neutral-600">
-            {info.publishedDate && <span>{info.publishedDate}</span>}
-            {info.pageCount && <span>• {info.pageCount} pages</span>}
-            {info.categories?.length ? <span>• {info.categories[0]}</span> : null}
+    <a href={href} target="_blank" rel="noreferrer" className={BTN_CLASS}>
+      {label}
+    </a>
+  );
+});
+
+// Takes a normalized volume (see normalize). Memoized: `volume` objects only change identity
+// when a fetch resolves, so typing/loading re-renders of the parent skip every card
+const ResultCard = React.memo(
+  function ResultCard({ volume }) {
+    // content-visibility lets the browser skip layout/paint for off-screen cards; the intrinsic
+    // size is roughly one card's height so the scrollbar stays stable
+    return (
+      <article className="group rounded-2xl border border-neutral-200 bg-white p-4 shadow-sm hover:shadow-md transition-shadow focus-within:shadow-md [content-visibility:auto] [contain-intrinsic-size:auto_200px]">
+        <div className="grid grid-cols-[96px,1fr] gap-4">
+          <div className="overflow-hidden rounded-xl border bg-neutral-50">
+            <img
+              src={volume.thumb}
+              alt={`Cover of ${volume.title}`}
+              className="h-36 w-24 object-cover object-center transition-transform group-hover:scale-[1.02]"
+              loading="lazy"
+              decoding="async"
+              fetchpriority="low"
+            />
           </div>
-          {typeof info.averageRating === "number" && (
-            <div className="mt-2"><StarRating value={info.averageRating} /></div>
-          )}
-          <div className="mt-3 flex flex-wrap gap-2">
-            {info.previewLink && (
-              <a
-                href={info.previewLink}
-                target="_blank"
-                rel="noreferrer"
-                className="rounded-xl border px-3 py-1.5 text-xs font-medium hover:bg-neutral-50 focus:outline-none focus:ring-2 focus:ring-neutral-400"
-              >
-                Preview
-              </a>
-            )}
-            {sale.buyLink && (
-              <a
-                href={sale.buyLink}
-                target="_blank"
-                rel="noreferrer"
-                className="rounded-xl border px-3 py-1.5 text-xs font-medium hover:bg-neutral-50 focus:outline-none focus:ring-2 focus:ring-neutral-400"
-              >
-                Buy
-              </a>
+          <div className="min-w-0">
+            <h3 className="text-base font-semibold leading-snug line-clamp-2" title={volume.title}>
+              {volume.title}
+            </h3>
+            {volume.authors && (
+              <p className="mt-1 text-sm text-neutral-600 line-clamp-1" title={volume.authors}>
+                {volume.authors}
+              </p>
             )}
-            {info.infoLink && (
-              <a
-                href={info.infoLink}
-                target="_blank"
-                rel="noreferrer"
-                className="rounded-xl border px-3 py-1.5 text-xs font-medium hover:bg-neutral-50 focus:outline-none focus:ring-2 focus:ring-neutral-400"
-              >
-                Details
-              </a>
+            <div className="mt-2 flex flex-wrap items-center gap-2 text-xs text-neutral-600">
+              {volume.publishedDate && <span>{volume.publishedDate}</span>}
+              {volume.pageCount && <span>• {volume.pageCount} pages</span>}
+              {volume.category && <span>• {volume.category}</span>}
+            </div>
+            {volume.rating !== null && (
+              <div className="mt-2"><StarRating value={volume.rating} /></div>
             )}
+            <div className="mt-3 flex flex-wrap gap-2">
+              <LinkButton href={volume.previewLink} label="Preview" />
+              <LinkButton href={volume.buyLink} label="Buy" />
+              <LinkButton href={volume.infoLink} label="Details" />
+            </div>
           </div>
         </div>
-      </div>
-    </article>
-  );
-}
+      </article>
+    );
+  },
+  (a, b) => a.volume === b.volume
+);
 
 export default function BookFinderApp() {
-  const [query, setQuery] = useState("harry potter");
+  const [query, setQuery] = useState("harry potter"); // normalized, drives the URL and cache key
+  const [shownQuery, setShownQuery] = useState("harry potter"); // as the user typed it
   const [input, setInput] = useState("harry potter");
   const [page, setPage] = useState(0); // zero-based page index
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState("");
-  const [items, setItems] = useState([]);
+  const [items, setItems] = useState([]); // every item of the current window, not just this page
+  const [itemsUrl, setItemsUrl] = useState(""); // window URL `items` came from
   const [total, setTotal] = useState(0);
   const controller = useRef(null);
-  const cache = useRef(new Map()); // simple in-memory cache per session
+  const prefetchController = useRef(null); // separate so typing doesn't cancel a prefetch
+  const speculativeController = useRef(null); // at most one speculative query fetch in flight
+  const cache = useRef(null); // bounded in-memory LRU, see lruGet/lruSet
+  if (cache.current === null) cache.current = loadPersistedCache();
+  const persistTimer = useRef(null);
+  const sentinelRef = useRef(null); // end-of-results marker that triggers next-page prefetch
+  const inflight = useRef(new Map()); // url -> pending { items, total }, shared by every caller
 
   const startIndex = page * PAGE_SIZE;
+  const windowStart = Math.floor(page / WINDOW_PAGES) * WINDOW_SIZE;
+  const pageOffset = (page % WINDOW_PAGES) * PAGE_SIZE;
 
-  const searchUrl = useMemo(() => {
-    const base = "https://www.googleapis.com/books/v1/volumes";
-    const params = new URLSearchParams({
-      q: query || "",
-      startIndex: String(startIndex),
-      maxResults: String(PAGE_SIZE),
-      printType: "books",
-    });
-    // Optional: if you have an API key, append here, e.g. params.set('key', 'YOUR_KEY')
-    return `${base}?${params.toString()}`;
-  }, [query, startIndex]);
+  // Keyed by window, so paging inside a window never changes the URL or refetches
+  const searchUrl = useMemo(() => buildSearchUrl(query, windowStart), [query, windowStart]);
+  // The page on screen. Re-sliced (during render, before paint) only once `items` belong to the
+  // current window, so while a new window loads the last page stays up instead of a slice of
+  // the old window at the new offset.
+  const [shown, setShown] = useState({ items: [], source: null, offset: 0 });
+  if (itemsUrl === searchUrl && (shown.source !== items || shown.offset !== pageOffset)) {
+    setShown({ items: items.slice(pageOffset, pageOffset + PAGE_SIZE), source: items, offset: pageOffset });
+  }
+  const pageItems = shown.items;
+
+  // Write-through to the LRU, persisting to sessionStorage at most once per burst of writes
+  function remember(url, value) {
+    lruSet(cache.current, url, value);
+    clearTimeout(persistTimer.current);
+    persistTimer.current = setTimeout(() => {
+      persistTimer.current = null;
+      persistCache(cache.current);
+    }, 50);
+  }
+
+  // Coalesce concurrent requests for the same URL into one network round trip.
+  // `revalidate` makes the browser's HTTP cache send its own conditional request (If-None-Match
+  // with the stored ETag) and serve the cached body on a 304. Setting If-None-Match here instead
+  // is not CORS-safelisted, so it would cost a preflight per window URL and bypass that cache.
+  function request(url, signal, revalidate = false) {
+    let pending = inflight.current.get(url);
+    if (!pending) {
+      pending = fetch(url, { signal: withTimeout(signal), cache: revalidate ? "no-cache" : "default" })
+        .then(async (res) => {
+          if (!res.ok) throw new Error(`Request failed: ${res.status}`);
+          return parseBuffer(await res.arrayBuffer());
+        })
+        .finally(() => inflight.current.delete(url));
+      inflight.current.set(url, pending);
+    }
+    return pending;
+  }
+
+  // Like request(), but if we joined a request someone else aborted (e.g. a prefetch, or the
+  // previous run of the fetch effect), retry under our own signal
+  async function requestOwn(url, signal, revalidate) {
+    try {
+      return await request(url, signal, revalidate);
+    } catch (err) {
+      if (err.name !== "AbortError" || signal.aborted) throw err;
+      return request(url, signal, revalidate);
+    }
+  }
+
+  // Warm the cache for a page the user is likely to open next; never touches React state
+  async function prefetch(url, ctrl = prefetchController) {
+    if (lruGet(cache.current, url) || inflight.current.has(url) || !canPrefetch()) return;
+    if (ctrl.current) ctrl.current.abort();
+    ctrl.current = new AbortController();
+    try {
+      remember(url, await request(url, ctrl.current.signal));
+    } catch {
+      // Prefetch is best-effort; the real fetch will surface any error
+    }
+  }
 
   useEffect(() => {
     let active = true;
@@ -130,27 +390,32 @@ export default function BookFinderApp() {
       if (controller.current) controller.current.abort();
       controller.current = new AbortController();
 
-      if (cache.current.has(cacheKey)) {
-        const cached = cache.current.get(cacheKey);
+      // Stale-while-revalidate: show cached results immediately, then refresh them in the background
+      const cached = lruGet(cache.current, cacheKey);
+      if (cached) {
         setItems(cached.items);
+        setItemsUrl(cacheKey);
         setTotal(cached.total);
         setLoading(false);
-        return;
+        if (Date.now() - cached.ts < REVALIDATE_AFTER_MS) return;
       }
 
       try {
-        const res = await fetch(searchUrl, { signal: controller.current.signal });
-        if (!res.ok) throw new Error(`Request failed: ${res.status}`);
-        const data = await res.json();
+        // A background revalidation goes through the HTTP cache's ETag check, so an unchanged
+        // page is a bodiless 304 on the wire
+        const { items, total } = await requestOwn(searchUrl, controller.current.signal, !!cached);
         if (!active) return;
-        const items = Array.isArray(data.items) ? data.items : [];
-        const total = typeof data.totalItems === "number" ? data.totalItems : items.length;
-        cache.current.set(cacheKey, { items, total });
-        setItems(items);
+        remember(cacheKey, { items, total });
+        // Keep the already-rendered array (and memoized cards) when revalidation changed nothing
+        if (!cached || !sameIds(cached.items, items)) setItems(items);
+        setItemsUrl(cacheKey);
         setTotal(total);
       } catch (err) {
-        if (err.name !== "AbortError") {
-          setError(err.message || "Something went wrong");
+        // A failed background revalidation keeps the cached results on screen
+        if (err.name !== "AbortError" && !cached) {
+          // Don't leave the previous page's cards under the new page number
+          setShown({ items: [], source: null, offset: 0 });
+          setError(err.name === "TimeoutError" ? "Request timed out" : err.message || "Something went wrong");
         }
       } finally {
         if (active) setLoading(false);
@@ -163,17 +428,73 @@ export default function BookFinderApp() {
     };
   }, [searchUrl]);
 
+  // Open the cover-image connection early so the first thumbnails skip DNS/TLS setup
+  useEffect(() => {
+    const link = document.createElement("link");
+    link.rel = "preconnect";
+    link.href = "https://books.google.com";
+    document.head.appendChild(link);
+    return () => link.remove();
+  }, []);
+
+  // Drop any outstanding prefetch on unmount
+  useEffect(
+    () => () => {
+      prefetchController.current?.abort();
+      speculativeController.current?.abort();
+      if (persistTimer.current) {
+        clearTimeout(persistTimer.current);
+        persistCache(cache.current);
+      }
+    },
+    []
+  );
+
+  function submitQuery() {
+    setPage(0);
+    setQuery(normalizeQuery(input));
+    setShownQuery(input.trim());
+  }
+
   // Debounce user typing -> update query
   useEffect(() => {
-    const id = setTimeout(() => {
-      setPage(0);
-      setQuery(input.trim());
-    }, 400);
+    const id = setTimeout(submitQuery, 400);
+    return () => clearTimeout(id);
+  }, [input]);
+
+  // Speculatively fetch page 0 for the partial input while the debounce is still waiting,
+  // so the committed query above usually resolves from cache
+  useEffect(() => {
+    const q = normalizeQuery(input);
+    if (!q || q === query) return;
+    const id = setTimeout(() => prefetch(buildSearchUrl(q, 0), speculativeController), 150);
     return () => clearTimeout(id);
   }, [input]);
 
   const hasPrev = page > 0;
   const hasNext = startIndex + PAGE_SIZE < total;
+  // URL the next page will need; equals searchUrl while the next page is inside the current window
+  const nextUrl = buildSearchUrl(query, Math.floor((page + 1) / WINDOW_PAGES) * WINDOW_SIZE);
+
+  // Only prefetch the next page once the user scrolls near the end of the results
+  useEffect(() => {
+    if (!hasNext || loading || nextUrl === searchUrl) return;
+    const sentinel = sentinelRef.current;
+    if (!sentinel || typeof IntersectionObserver === "undefined") {
+      prefetch(nextUrl);
+      return;
+    }
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (!entries[0].isIntersecting) return;
+        observer.disconnect();
+        prefetch(nextUrl);
+      },
+      { rootMargin: "200px" }
+    );
+    observer.observe(sentinel);
+    return () => observer.disconnect();
+  }, [nextUrl, searchUrl, hasNext, loading, pageItems]);
 
   return (
     <div className="min-h-screen bg-gradient-to-b from-neutral-50 to-white text-neutral-900">
@@ -189,19 +510,13 @@ export default function BookFinderApp() {
                 className="w-full rounded-2xl border px-4 py-2.5 pr-10 shadow-sm focus:outline-none focus:ring-2 focus:ring-neutral-400"
                 aria-label="Search books"
                 onKeyDown={(e) => {
-                  if (e.key === "Enter") {
-                    setPage(0);
-                    setQuery(input.trim());
-                  }
+                  if (e.key === "Enter") submitQuery();
                 }}
               />
               <span className="pointer-events-none absolute right-3 top-1/2 -translate-y-1/2 text-neutral-500">⌘K</span>
             </div>
             <button
-              onClick={() => {
-                setPage(0);
-                setQuery(input.trim());
-              }}
+              onClick={submitQuery}
               className="rounded-2xl border px-4 py-2.5 text-sm font-semibold shadow-sm hover:bg-neutral-50 focus:outline-none focus:ring-2 focus:ring-neutral-400"
             >
               Search
@@ -210,19 +525,19 @@ export default function BookFinderApp() {
         </div>
       </header>
 
-      <main className="mx-auto max-w-6xl px-4 py-6">
+      <main className="mx-auto max-w-6xl px-4 py-6" aria-busy={loading}>
         {/* Status Row */}
         <div className="mb-4 flex flex-wrap items-center justify-between gap-3 text-sm text-neutral-600">
           <div>
             {loading ? (
-              <span className="inline-flex items-center gap-2"><span className="h-3 w-3 animate-spin rounded-full border-2 border-neutral-300 border-t-transparent"/> Searching “{query}”…</span>
+              <span className="inline-flex items-center gap-2"><span className="h-3 w-3 animate-spin rounded-full border-2 border-neutral-300 border-t-transparent"/> Searching “{shownQuery}”…</span>
             ) : error ? (
               <span className="text-red-600">{error}</span>
             ) : (
               <span>
                 {total ? (
                   <>
-                    Found <strong className="text-neutral-900">{total.toLocaleString()}</strong> results for “{query}”.
+                    Found <strong className="text-neutral-900">{total.toLocaleString()}</strong> results for “{shownQuery}”.
                   </>
                 ) : (
                   <>Type to search books.</>
@@ -255,24 +570,17 @@ export default function BookFinderApp() {
 
         {/* Results Grid */}
         {loading && !items.length ? (
-          <div className="grid grid-cols-2 sm:grid-cols-3 lg:grid-cols-4 gap-4">
-            {Array.from({ length: PAGE_SIZE }).map((_, i) => (
-              <div key={i} className="animate-pulse rounded-2xl border bg-white p-4">
-                <div className="h-36 w-24 rounded-xl bg-neutral-200" />
-                <div className="mt-3 h-4 w-3/4 rounded bg-neutral-200" />
-                <div className="mt-2 h-3 w-1/2 rounded bg-neutral-200" />
-              </div>
-            ))}
-          </div>
-        ) : items.length ? (
+          <div className="h-[600px] animate-pulse rounded-2xl" style={SKELETON_STYLE} />
+        ) : pageItems.length ? (
           <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-4">
-            {items.map((vol) => (
+            {pageItems.map((vol) => (
               <ResultCard key={vol.id} volume={vol} />
             ))}
           </div>
         ) : (
           <div className="mt-20 text-center text-neutral-500">No results. Try a different search term.</div>
         )}
+        <div ref={sentinelRef} aria-hidden="true" />
 
         {/* Footer */}
         <footer className="mt-10 text-center text-xs text-neutral-500">